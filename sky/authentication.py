@@ -440,7 +440,7 @@ def setup_primeintellect_authentication(
         public_key = f.read().strip()
 
     # Register the public key with Prime Intellect (no-op if already exists)
-    client = primeintellect_utils.PrimeIntellectAPIClient()
+    client = primeintellect_utils.client
     client.get_or_add_ssh_key(public_key)
 
     # Set up auth section for Ray template
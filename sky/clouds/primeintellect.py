@@ -256,18 +256,19 @@ class PrimeIntellect(clouds.Cloud):
     def _check_credentials(cls) -> Tuple[bool, Optional[str]]:
         """Verify that the user has valid credentials for Prime Intellect."""
 
-        primeintellect_config_file = '~/.prime/config.json'
-        if not os.path.isfile(os.path.expanduser(primeintellect_config_file)):
-            return (False, f'{primeintellect_config_file} does not exist.')
-
-        with open(os.path.expanduser(primeintellect_config_file),
-                  encoding='UTF-8') as f:
-            data = json.load(f)
-            api_key = data.get('api_key')
-            if not api_key:
-                print('API key is missing or empty')
-
-        client = utils.PrimeIntellectAPIClient()
+        # Resolution honors PRIMEINTELLECT_API_KEY, so an env-var-only
+        # setup passes the check without a ~/.prime/config.json file.
+        try:
+            credentials = utils.resolve_credentials(
+                os.path.expanduser(utils.CREDENTIALS_PATH))
+        except utils.PrimeintellectAPIError as e:
+            return False, str(e)
+        if not credentials.get('api_key'):
+            return False, ('API key is missing or empty. Set '
+                           'PRIMEINTELLECT_API_KEY or run \'prime login\' '
+                           'to configure an API key.')
+
+        client = utils.client
         try:
             client.list_instances()
         except utils.PrimeintellectAPIError as e:
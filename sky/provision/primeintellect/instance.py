@@ -28,7 +28,7 @@ SSH_CONN_RETRY_INTERVAL_SECONDS = 10
 
 def _filter_instances(cluster_name_on_cloud: str,
                       status_filters: Optional[List[str]]) -> Dict[str, Any]:
-    client = utils.PrimeIntellectAPIClient()
+    client = utils.client
     instances = client.list_instances()
     # TODO: verify names are we using it?
     possible_names = [
@@ -49,7 +49,7 @@ def _filter_instances(cluster_name_on_cloud: str,
 
 
 def _get_instance_info(instance_id: str) -> Dict[str, Any]:
-    client = utils.PrimeIntellectAPIClient()
+    client = utils.client
     return client.get_instance_details(instance_id)
 
 
@@ -75,7 +75,7 @@ def run_instances(region: str, cluster_name: str, cluster_name_on_cloud: str,
     ]
     newly_started_instances = _filter_instances(cluster_name_on_cloud,
                                                 pending_status)
-    client = utils.PrimeIntellectAPIClient()
+    client = utils.client
 
     while True:
         instances = _filter_instances(cluster_name_on_cloud, pending_status)
@@ -264,7 +264,7 @@ def terminate_instances(
 ) -> None:
     """See sky/provision/__init__.py"""
     del provider_config  # unused
-    client = utils.PrimeIntellectAPIClient()
+    client = utils.client
     instances = _filter_instances(cluster_name_on_cloud, None)
 
     # Log if no instances found
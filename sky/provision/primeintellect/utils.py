@@ -1,19 +1,28 @@
 """Prime Intellect library wrapper for SkyPilot."""
 
-import json
+import csv
+import functools
 import os
+import re
 import shlex
 import time
+import typing
 from typing import Any, Dict, List, Optional, Tuple, Union
 import uuid
 
-import requests
+import orjson
 
-from sky.catalog import common as catalog_common
+from sky.adaptors import common as adaptors_common
 from sky.utils import common_utils
 
-_df = None
-_lookup_dict = None
+# Lazy imports: pandas-backed catalog helpers and requests are only needed
+# by some code paths (e.g., not by instance termination), so defer their
+# import cost until first use.
+if typing.TYPE_CHECKING:
+    import requests
+else:
+    requests = adaptors_common.LazyImport('requests')
+catalog_common = adaptors_common.LazyImport('sky.catalog.common')
 
 # Base URL for Prime Intellect API (used as default if not configured).
 DEFAULT_BASE_URL = 'https://api.primeintellect.ai'
@@ -21,6 +30,8 @@ CREDENTIALS_PATH = '~/.prime/config.json'
 INITIAL_BACKOFF_SECONDS = 10
 MAX_BACKOFF_FACTOR = 10
 MAX_ATTEMPTS = 6
+# Upper bound on any single retry sleep, jitter and Retry-After included.
+MAX_RETRY_DELAY_SECONDS = MAX_BACKOFF_FACTOR * INITIAL_BACKOFF_SECONDS
 
 
 class PrimeintellectAPIError(Exception):
@@ -40,6 +51,14 @@ class PrimeintellectResourcesUnavailableError(PrimeintellectAPIError):
     pass
 
 
+# Error-message markers indicating resource unavailability (capacity,
+# stock, or quota issues). Compiled once so classifying an error takes a
+# single case-insensitive scan instead of a keyword loop.
+_RESOURCE_UNAVAILABLE_RE = re.compile(
+    r'no capacity|capacity|unavailable|out of stock|insufficient|'
+    r'not available|quota exceeded|limit exceeded', re.IGNORECASE)
+
+
 def _parse_api_error(response: Any) -> Tuple[str, bool]:
     """Parse API error response to extract meaningful error messages.
 
@@ -50,8 +69,8 @@ def _parse_api_error(response: Any) -> Tuple[str, bool]:
           capacity issues or quota/limit exceeded), otherwise False.
     """
     try:
-        if hasattr(response, 'json'):
-            error_data = response.json()
+        if hasattr(response, 'content'):
+            error_data = orjson.loads(response.content)
         else:
             error_data = response
 
@@ -62,13 +81,12 @@ def _parse_api_error(response: Any) -> Tuple[str, bool]:
                 error_message = error_data.get('error', '')
             if not error_message:
                 error_message = error_data.get('detail', '')
+            if not isinstance(error_message, str):
+                # e.g. FastAPI validation errors put a list under 'detail'.
+                error_message = str(error_message)
 
             # Check if it's a resource unavailability error
-            if any(keyword in error_message.lower() for keyword in [
-                    'no capacity', 'capacity', 'unavailable', 'out of stock',
-                    'insufficient', 'not available', 'quota exceeded',
-                    'limit exceeded'
-            ]):
+            if _RESOURCE_UNAVAILABLE_RE.search(error_message):
                 return error_message, True
 
             return error_message, False
@@ -78,48 +96,86 @@ def _parse_api_error(response: Any) -> Tuple[str, bool]:
         return f'HTTP {response.status_code} {response.reason}', False
 
 
+_SUPPORTED_METHODS = frozenset({'get', 'post', 'put', 'patch', 'delete'})
+# Rate limiting and transient server errors are retried with backoff;
+# other HTTP errors surface to the caller immediately.
+_RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def _retry_delay_seconds(backoff: common_utils.Backoff,
+                         response_headers: Optional[Any] = None) -> float:
+    """Computes the next retry delay, honoring Retry-After.
+
+    common_utils.Backoff already jitters the exponential delay, which
+    desynchronizes concurrent clients retrying against the same endpoint; a
+    server-provided Retry-After hint takes precedence when it is longer
+    than the computed backoff.
+    """
+    delay = backoff.current_backoff()
+    retry_after = 0.0
+    if response_headers is not None:
+        try:
+            retry_after = float(response_headers.get('Retry-After', 0))
+        except (TypeError, ValueError):
+            retry_after = 0.0
+    return min(max(delay, retry_after), MAX_RETRY_DELAY_SECONDS)
+
+
 def _try_request_with_backoff(
         method: str,
         url: str,
         headers: Dict[str, str],
-        data: Optional[Union[str, Dict[str, Any]]] = None) -> Dict[str, Any]:
+        data: Optional[Union[str, Dict[str, Any]]] = None,
+        session: Optional['requests.Session'] = None) -> Dict[str, Any]:
+    if method not in _SUPPORTED_METHODS:
+        raise ValueError(f'Unsupported requests method: {method}')
+    # Reuse the caller's session (connection pool) when provided; fall back
+    # to the module-level requests helpers for one-off calls.
+    requester = requests if session is None else session
     backoff = common_utils.Backoff(initial_backoff=INITIAL_BACKOFF_SECONDS,
                                    max_backoff_factor=MAX_BACKOFF_FACTOR)
+    timeout = 30
     for i in range(MAX_ATTEMPTS):
-        timeout = 30
-        if method == 'get':
-            response = requests.get(url,
-                                    headers=headers,
-                                    params=data,
-                                    timeout=timeout)
-        elif method == 'post':
-            response = requests.post(url,
-                                     headers=headers,
-                                     json=data,
-                                     timeout=timeout)
-        elif method == 'put':
-            response = requests.put(url,
-                                    headers=headers,
-                                    json=data,
-                                    timeout=timeout)
-        elif method == 'patch':
-            response = requests.patch(url,
-                                      headers=headers,
-                                      json=data,
-                                      timeout=timeout)
-        elif method == 'delete':
-            response = requests.delete(url, headers=headers, timeout=timeout)
-        else:
-            raise ValueError(f'Unsupported requests method: {method}')
-        # If rate limited, wait and try again
-        if response.status_code == 429 and i != MAX_ATTEMPTS - 1:
-            time.sleep(backoff.current_backoff())
+        try:
+            # GET sends the payload as query params; all other methods send
+            # a JSON body.
+            response = requester.request(
+                method,
+                url,
+                headers=headers,
+                params=data if method == 'get' else None,
+                json=data if method != 'get' else None,
+                timeout=timeout)
+        except (requests.exceptions.ConnectionError,
+                requests.exceptions.Timeout,
+                requests.exceptions.ChunkedEncodingError) as e:
+            # Transient network failures are retried like rate limiting.
+            if i == MAX_ATTEMPTS - 1:
+                raise PrimeintellectAPIError(
+                    f'API request failed: {method} {url}: {e}') from e
+            time.sleep(_retry_delay_seconds(backoff))
+            continue
+        # If rate limited or the server hit a transient error, wait and try
+        # again.
+        if (response.status_code in _RETRYABLE_STATUS_CODES and
+                i != MAX_ATTEMPTS - 1):
+            time.sleep(_retry_delay_seconds(backoff, response.headers))
             continue
         if response.ok:
-            return response.json()
+            # orjson decodes the raw bytes considerably faster than
+            # response.json(), which matters for bulk list responses.
+            return orjson.loads(response.content)
         else:
+            # Decode the error body once; it doubles as the parse input and
+            # the structured response_data on the raised exception.
+            try:
+                error_data: Optional[Any] = orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                error_data = None
+
             # Parse the error response for meaningful messages
-            err, is_resource_unavailable = _parse_api_error(response)
+            err, is_resource_unavailable = _parse_api_error(
+                response if error_data is None else error_data)
 
             # Create a more informative error message
             if not err:
@@ -133,24 +189,91 @@ def _try_request_with_backoff(
                 raise PrimeintellectResourcesUnavailableError(
                     err,
                     status_code=response.status_code,
-                    response_data=response.json()
-                    if hasattr(response, 'json') else None)
+                    response_data=error_data)
             else:
-                raise PrimeintellectAPIError(
-                    err,
-                    status_code=response.status_code,
-                    response_data=response.json()
-                    if hasattr(response, 'json') else None)
+                raise PrimeintellectAPIError(err,
+                                             status_code=response.status_code,
+                                             response_data=error_data)
     return {}
 
 
+@functools.lru_cache(maxsize=1)
+def _get_upstream_cloud_id_lookup() -> Dict[str, str]:
+    """Builds the InstanceType -> UpstreamCloudId lookup from the catalog.
+
+    Cached so the catalog CSV is parsed at most once per process; repeated
+    lookups during provisioning become plain dict hits. The two columns we
+    need are read with the stdlib csv module to avoid paying the pandas
+    import on the provisioning path.
+    """
+    catalog_path = catalog_common.get_catalog_path('primeintellect/vms.csv')
+    if not os.path.exists(catalog_path):
+        # Fall back to the shared catalog machinery, which downloads the
+        # catalog on first use.
+        df = catalog_common.read_catalog('primeintellect/vms.csv')
+        return df.set_index('InstanceType')['UpstreamCloudId'].to_dict()
+    with open(catalog_path, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.DictReader(f)
+        return {row['InstanceType']: row['UpstreamCloudId'] for row in reader}
+
+
 def get_upstream_cloud_id(instance_type: str) -> Optional[str]:
-    global _df, _lookup_dict
-    if _df is None:
-        _df = catalog_common.read_catalog('primeintellect/vms.csv')
-        _lookup_dict = (
-            _df.set_index('InstanceType')['UpstreamCloudId'].to_dict())
-    return _lookup_dict.get(instance_type)
+    return _get_upstream_cloud_id_lookup().get(instance_type)
+
+
+# Parsed credentials cache, keyed on the credential file's mtime.
+_credentials_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+
+
+def _load_credentials(path: str) -> Dict[str, Any]:
+    """Loads and caches the parsed credentials file.
+
+    The parsed JSON is cached keyed on the file's mtime, so repeated client
+    constructions skip re-reading and re-parsing the file unless it has
+    changed on disk.
+    """
+    global _credentials_cache
+    try:
+        mtime = os.stat(path).st_mtime
+    except FileNotFoundError as e:
+        raise PrimeintellectAPIError(
+            f'Prime Intellect credentials not found at {path}. '
+            'Run `prime login` to configure an API key.') from e
+    if _credentials_cache is not None and _credentials_cache[0] == mtime:
+        return _credentials_cache[1]
+    # Read the file in one shot and decode with orjson, which is
+    # substantially faster than streaming through json.load.
+    with open(path, 'rb') as f:
+        credentials = orjson.loads(f.read())
+    _credentials_cache = (mtime, credentials)
+    return credentials
+
+
+# Environment variable overrides for the credentials file, as
+# (credential_key, env_var, default) triples resolved in one pass.
+_ENV_MAP = (
+    ('api_key', 'PRIMEINTELLECT_API_KEY', None),
+    ('team_id', 'PRIMEINTELLECT_TEAM_ID', None),
+    ('base_url', 'PRIMEINTELLECT_BASE_URL', None),
+)
+
+
+def resolve_credentials(path: str) -> Dict[str, Any]:
+    """Resolves credentials from environment variables and the file.
+
+    Environment variables take precedence over file values; when
+    PRIMEINTELLECT_API_KEY is set, the credentials file is not required.
+    """
+    env = {
+        key: os.environ.get(env_var, default)
+        for key, env_var, default in _ENV_MAP
+    }
+    overrides = {key: value for key, value in env.items() if value is not None}
+    if env['api_key']:
+        return overrides
+    credentials = dict(_load_credentials(path))
+    credentials.update(overrides)
+    return credentials
 
 
 class PrimeIntellectAPIClient:
@@ -158,29 +281,73 @@ class PrimeIntellectAPIClient:
 
     def __init__(self) -> None:
         self.credentials = os.path.expanduser(CREDENTIALS_PATH)
-        assert os.path.exists(self.credentials), 'Credentials not found'
-        with open(self.credentials, 'r', encoding='utf-8') as f:
-            self._credentials = json.load(f)
-        self.api_key = self._credentials.get('api_key')
-        self.team_id = self._credentials.get('team_id')
-        self.base_url = self._credentials.get('base_url', DEFAULT_BASE_URL)
+        # _load_credentials raises PrimeintellectAPIError if the file is
+        # missing; no separate existence check (which would be skipped
+        # under python -O if written as an assert, and costs an extra stat).
+        self._apply_credentials(resolve_credentials(self.credentials))
+        # Persistent session so sequential API calls reuse the same TCP/TLS
+        # connection instead of handshaking on every request.
+        self._session = requests.Session()
+        self._session.mount(
+            'https://',
+            requests.adapters.HTTPAdapter(pool_connections=4,
+                                          pool_maxsize=8,
+                                          max_retries=0))
+
+    def _apply_credentials(self, credentials: Dict[str, Any]) -> None:
+        self._credentials = credentials
+        self.api_key = credentials.get('api_key')
+        self.team_id = credentials.get('team_id')
+        self.base_url = credentials.get('base_url', DEFAULT_BASE_URL)
         self.headers = {
             'Authorization': f'Bearer {self.api_key}',
             'Content-Type': 'application/json'
         }
 
-    def list_instances(self, **search_kwargs) -> List[Dict[str, Any]]:
-        response = _try_request_with_backoff('get',
-                                             f'{self.base_url}/api/v1/pods',
+    def _refresh_credentials(self) -> None:
+        """Re-resolves credentials, bypassing the mtime cache."""
+        global _credentials_cache
+        _credentials_cache = None
+        self._apply_credentials(resolve_credentials(self.credentials))
+
+    def _request(
+            self,
+            method: str,
+            url: str,
+            data: Optional[Union[str, Dict[str,
+                                           Any]]] = None) -> Dict[str, Any]:
+        """Dispatches an API call, refreshing credentials once on 401.
+
+        The API uses long-lived bearer keys rather than minted tokens, so
+        there is no token handshake to cache. On an auth failure the
+        credentials file is re-read in case the key was rotated on disk,
+        and the call is retried once with the fresh key.
+        """
+        try:
+            return _try_request_with_backoff(method,
+                                             url,
                                              headers=self.headers,
-                                             data=search_kwargs)
+                                             data=data,
+                                             session=self._session)
+        except PrimeintellectAPIError as e:
+            if e.status_code != 401:
+                raise
+            self._refresh_credentials()
+            return _try_request_with_backoff(method,
+                                             url,
+                                             headers=self.headers,
+                                             data=data,
+                                             session=self._session)
+
+    def list_instances(self, **search_kwargs) -> List[Dict[str, Any]]:
+        response = self._request('get',
+                                 f'{self.base_url}/api/v1/pods',
+                                 data=search_kwargs)
         return response['data']
 
     def get_instance_details(self, instance_id: str) -> Dict[str, Any]:
-        return _try_request_with_backoff(
-            'get',
-            f'{self.base_url}/api/v1/pods/{instance_id}',
-            headers=self.headers)
+        return self._request('get',
+                             f'{self.base_url}/api/v1/pods/{instance_id}')
 
     def launch(self,
                name: str,
@@ -236,9 +403,11 @@ class PrimeIntellectAPIClient:
         assert availability_zone, 'availability_zone cannot be None'
 
         # Parse the instance_type. We only need the first two components:
-        # provider and accelerator info (see docstring above).
-        provider, gpu_parts, _, _ = instance_type.split('__', 3)
-        if 'CPU_NODE' in gpu_parts:
+        # provider and accelerator info (see docstring above), so partition
+        # instead of splitting out the unused vcpus/memory tail.
+        provider, _, rest = instance_type.partition('__')
+        gpu_parts = rest.partition('__')[0]
+        if gpu_parts == 'CPU_NODE':
             # Prime Intellect API uses the same schema for CPU-only and GPU
             # pods. For CPU-only instances, we set gpuType='CPU_NODE' and
             # gpuCount=1 as a sentinel to indicate "no GPU". This is how CPU
@@ -281,42 +450,38 @@ class PrimeIntellectAPIClient:
         if self.team_id is not None and self.team_id != '':
             payload['team'] = {'teamId': self.team_id}
 
-        response = _try_request_with_backoff(
-            'post',
-            f'{self.base_url}/api/v1/pods',
-            headers=self.headers,
-            data=payload,
-        )
+        response = self._request('post',
+                                 f'{self.base_url}/api/v1/pods',
+                                 data=payload)
         return response
 
     def remove(self, instance_id: str) -> Dict[str, Any]:
-        return _try_request_with_backoff(
-            'delete',
-            f'{self.base_url}/api/v1/pods/{instance_id}',
-            headers=self.headers,
-        )
+        return self._request('delete',
+                             f'{self.base_url}/api/v1/pods/{instance_id}')
 
     def list_ssh_keys(self) -> List[Dict[str, Any]]:
-        response = _try_request_with_backoff('get',
-                                             f'{self.base_url}/api/v1/ssh_keys',
-                                             headers=self.headers)
+        response = self._request('get', f'{self.base_url}/api/v1/ssh_keys')
         return response['data']
 
     def get_or_add_ssh_key(self, ssh_pub_key: str = '') -> Dict[str, str]:
         """Add ssh key if not already added."""
-        # Check if the public key is already added
-        ssh_keys = self.list_ssh_keys()
-        for key in ssh_keys:
-            if key['publicKey'].strip().split()[:2] == ssh_pub_key.strip(
-            ).split()[:2]:
-                return {'name': key['name'], 'ssh_key': ssh_pub_key}
+        # Check if the public key is already added. Keys are compared by
+        # their (algorithm, base64-blob) prefix, ignoring the comment; build
+        # the lookup once so each candidate is tokenized a single time.
+        target = tuple(ssh_pub_key.strip().split()[:2])
+        existing = {
+            tuple(key['publicKey'].strip().split()[:2]): key
+            for key in self.list_ssh_keys()
+        }
+        hit = existing.get(target)
+        if hit is not None:
+            return {'name': hit['name'], 'ssh_key': ssh_pub_key}
 
         # Add the public key to Prime Intellect account if not already added
         ssh_key_name = 'skypilot-' + str(uuid.uuid4()).replace('-', '')[:8]
-        _try_request_with_backoff(
+        self._request(
             'post',
             f'{self.base_url}/api/v1/ssh_keys',
-            headers=self.headers,
             data={
                 'name': ssh_key_name,
                 'publicKey': ssh_pub_key
@@ -325,6 +490,22 @@ class PrimeIntellectAPIClient:
         return {'name': ssh_key_name, 'ssh_key': ssh_pub_key}
 
 
+# Lazily constructed module-level client (PEP 562). Accessing
+# `utils.client` builds the client on first use and then reuses it, so
+# sequential provisioning operations share one session, credentials parse,
+# and connection pool.
+_client: Optional[PrimeIntellectAPIClient] = None
+
+
+def __getattr__(name: str) -> Any:  # pylint: disable=invalid-name
+    if name == 'client':
+        global _client
+        if _client is None:
+            _client = PrimeIntellectAPIClient()
+        return _client
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
 def parse_ssh_connection(ssh_connection: Any) -> Tuple[Optional[str], int]:
     """Parse and extract SSH username and port from a connection field.
 
@@ -0,0 +1,577 @@
+"""Tests for Prime Intellect cloud provider."""
+
+import json
+import os
+
+import pytest
+
+from sky.clouds import primeintellect as pi_cloud
+from sky.provision.primeintellect import utils as pi_utils
+
+
+class _FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, status_code=200, payload=None, headers=None):
+        self.status_code = status_code
+        self._payload = payload if payload is not None else {}
+        self.content = json.dumps(self._payload).encode('utf-8')
+        self.headers = headers or {}
+        self.reason = 'OK' if status_code < 400 else 'Error'
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    def json(self):
+        return self._payload
+
+
+class _FakeSession:
+    """Records requests and replays canned responses."""
+
+    def __init__(self, responses):
+        self._responses = list(responses)
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        return self._responses.pop(0)
+
+
+class TestParseApiError:
+    """Test cases for _parse_api_error classification."""
+
+    @pytest.mark.parametrize('message', [
+        'No capacity in this region',
+        'Instance type currently UNAVAILABLE',
+        'GPU out of stock',
+        'Quota exceeded for team',
+    ])
+    def test_capacity_errors_are_flagged(self, message):
+        """Test capacity/quota messages are classified as unavailability."""
+        err, is_unavailable = pi_utils._parse_api_error(  # pylint: disable=protected-access
+            {'message': message})
+        assert err == message
+        assert is_unavailable
+
+    def test_other_errors_are_not_flagged(self):
+        """Test unrelated errors are not classified as unavailability."""
+        err, is_unavailable = pi_utils._parse_api_error(  # pylint: disable=protected-access
+            {'message': 'Invalid API key'})
+        assert err == 'Invalid API key'
+        assert not is_unavailable
+
+    def test_non_string_detail_is_coerced(self):
+        """Test structured error fields (e.g. FastAPI 422) don't raise."""
+        detail = [{'loc': ['body', 'pod'], 'msg': 'field required'}]
+        err, is_unavailable = pi_utils._parse_api_error(  # pylint: disable=protected-access
+            {'detail': detail})
+        assert 'field required' in err
+        assert not is_unavailable
+
+
+class TestRetryDelay:
+    """Test cases for _retry_delay_seconds."""
+
+    def _backoff(self):
+        return pi_utils.common_utils.Backoff(
+            initial_backoff=pi_utils.INITIAL_BACKOFF_SECONDS,
+            max_backoff_factor=pi_utils.MAX_BACKOFF_FACTOR)
+
+    def test_jitter_stays_within_bounds(self):
+        """Test the jittered delay stays within Backoff's jitter range."""
+        delay = pi_utils._retry_delay_seconds(self._backoff())  # pylint: disable=protected-access
+        base = pi_utils.INITIAL_BACKOFF_SECONDS
+        jitter = pi_utils.common_utils.Backoff.JITTER
+        assert (1 - jitter) * base <= delay <= (1 + jitter) * base
+
+    def test_retry_after_header_takes_precedence(self):
+        """Test a longer server Retry-After hint wins over the backoff."""
+        delay = pi_utils._retry_delay_seconds(  # pylint: disable=protected-access
+            self._backoff(), {'Retry-After': '42'})
+        assert delay >= 42
+
+    def test_delay_is_capped(self):
+        """Test the delay never exceeds MAX_RETRY_DELAY_SECONDS."""
+        delay = pi_utils._retry_delay_seconds(  # pylint: disable=protected-access
+            self._backoff(), {'Retry-After': '10000'})
+        assert delay == pi_utils.MAX_RETRY_DELAY_SECONDS
+
+    def test_malformed_retry_after_is_ignored(self):
+        """Test a non-numeric Retry-After falls back to the backoff."""
+        delay = pi_utils._retry_delay_seconds(  # pylint: disable=protected-access
+            self._backoff(), {'Retry-After': 'Wed, 21 Oct 2026 07:28:00 GMT'})
+        base = pi_utils.INITIAL_BACKOFF_SECONDS
+        jitter = pi_utils.common_utils.Backoff.JITTER
+        assert (1 - jitter) * base <= delay <= (1 + jitter) * base
+
+
+class TestTryRequestWithBackoff:
+    """Test cases for _try_request_with_backoff dispatch."""
+
+    def test_unsupported_method_raises(self):
+        """Test unknown HTTP methods are rejected before any request."""
+        with pytest.raises(ValueError, match='Unsupported requests method'):
+            pi_utils._try_request_with_backoff(  # pylint: disable=protected-access
+                'head',
+                'https://api.test',
+                headers={})
+
+    def test_get_sends_params_post_sends_json(self):
+        """Test GET uses query params while POST uses a JSON body."""
+        session = _FakeSession([
+            _FakeResponse(payload={'data': []}),
+            _FakeResponse(payload={'id': 'pod-1'}),
+        ])
+
+        pi_utils._try_request_with_backoff(  # pylint: disable=protected-access
+            'get',
+            'https://api.test/pods',
+            headers={},
+            data={'limit': 1},
+            session=session)
+        pi_utils._try_request_with_backoff(  # pylint: disable=protected-access
+            'post',
+            'https://api.test/pods',
+            headers={},
+            data={'name': 'p'},
+            session=session)
+
+        get_call, post_call = session.calls
+        assert get_call[0] == 'get'
+        assert get_call[2]['params'] == {'limit': 1}
+        assert get_call[2]['json'] is None
+        assert post_call[0] == 'post'
+        assert post_call[2]['params'] is None
+        assert post_call[2]['json'] == {'name': 'p'}
+
+    def test_transient_server_error_is_retried(self, monkeypatch):
+        """Test 503 responses are retried until the server recovers."""
+        monkeypatch.setattr(pi_utils.time, 'sleep', lambda seconds: None)
+        session = _FakeSession([
+            _FakeResponse(status_code=503),
+            _FakeResponse(status_code=502),
+            _FakeResponse(payload={'data': 'ok'}),
+        ])
+
+        response = pi_utils._try_request_with_backoff(  # pylint: disable=protected-access
+            'get',
+            'https://api.test/pods',
+            headers={},
+            session=session)
+
+        assert response == {'data': 'ok'}
+        assert len(session.calls) == 3
+
+    def test_connection_error_is_retried(self, monkeypatch):
+        """Test transient network errors are retried."""
+        import requests  # pylint: disable=import-outside-toplevel
+
+        monkeypatch.setattr(pi_utils.time, 'sleep', lambda seconds: None)
+
+        class _FlakySession:
+
+            def __init__(self):
+                self.attempts = 0
+
+            def request(self, *args, **kwargs):
+                del args, kwargs  # unused
+                self.attempts += 1
+                if self.attempts == 1:
+                    raise requests.exceptions.ConnectionError('reset')
+                return _FakeResponse(payload={'data': 'ok'})
+
+        session = _FlakySession()
+        response = pi_utils._try_request_with_backoff(  # pylint: disable=protected-access
+            'get',
+            'https://api.test/pods',
+            headers={},
+            session=session)
+
+        assert response == {'data': 'ok'}
+        assert session.attempts == 2
+
+    def test_connection_error_exhausts_attempts(self, monkeypatch):
+        """Test persistent network errors raise after max attempts."""
+        import requests  # pylint: disable=import-outside-toplevel
+
+        monkeypatch.setattr(pi_utils.time, 'sleep', lambda seconds: None)
+
+        class _DownSession:
+
+            def __init__(self):
+                self.attempts = 0
+
+            def request(self, *args, **kwargs):
+                del args, kwargs  # unused
+                self.attempts += 1
+                raise requests.exceptions.ConnectionError('reset')
+
+        session = _DownSession()
+        with pytest.raises(pi_utils.PrimeintellectAPIError,
+                           match='API request failed'):
+            pi_utils._try_request_with_backoff(  # pylint: disable=protected-access
+                'get',
+                'https://api.test/pods',
+                headers={},
+                session=session)
+
+        assert session.attempts == pi_utils.MAX_ATTEMPTS
+
+    def test_validation_error_raises_api_error(self):
+        """Test a 422 with a structured body raises PrimeintellectAPIError."""
+        session = _FakeSession([
+            _FakeResponse(status_code=422,
+                          payload={
+                              'detail': [{
+                                  'loc': ['body', 'pod'],
+                                  'msg': 'field required',
+                              }]
+                          })
+        ])
+
+        with pytest.raises(pi_utils.PrimeintellectAPIError,
+                           match='field required'):
+            pi_utils._try_request_with_backoff(  # pylint: disable=protected-access
+                'post',
+                'https://api.test/pods',
+                headers={},
+                session=session)
+
+    def test_client_error_is_not_retried(self):
+        """Test 4xx client errors surface immediately."""
+        session = _FakeSession(
+            [_FakeResponse(status_code=404, payload={'message': 'not found'})])
+
+        with pytest.raises(pi_utils.PrimeintellectAPIError, match='not found'):
+            pi_utils._try_request_with_backoff(  # pylint: disable=protected-access
+                'get',
+                'https://api.test/pods',
+                headers={},
+                session=session)
+
+        assert len(session.calls) == 1
+
+
+class TestCredentialsCache:
+    """Test cases for the credentials file cache."""
+
+    def test_reparsed_only_when_file_changes(self, monkeypatch, tmp_path):
+        """Test the credentials file is re-read only after modification."""
+        cred_file = tmp_path / 'config.json'
+        cred_file.write_text('{"api_key": "key-1"}')
+        monkeypatch.setattr(pi_utils, '_credentials_cache', None)
+
+        creds = pi_utils._load_credentials(str(cred_file))  # pylint: disable=protected-access
+        assert creds['api_key'] == 'key-1'
+        # Cached: same mtime returns the same parsed object.
+        assert pi_utils._load_credentials(str(cred_file)) is creds  # pylint: disable=protected-access
+
+        # Rewrite with a different mtime to invalidate the cache.
+        cred_file.write_text('{"api_key": "key-2"}')
+        os.utime(str(cred_file), (0, 0))
+        creds = pi_utils._load_credentials(str(cred_file))  # pylint: disable=protected-access
+        assert creds['api_key'] == 'key-2'
+
+    def test_missing_file_raises_api_error(self, monkeypatch, tmp_path):
+        """Test a missing credentials file raises PrimeintellectAPIError."""
+        monkeypatch.setattr(pi_utils, '_credentials_cache', None)
+        with pytest.raises(pi_utils.PrimeintellectAPIError,
+                           match='credentials not found'):
+            pi_utils._load_credentials(str(tmp_path / 'missing.json'))  # pylint: disable=protected-access
+
+
+class TestResolveCredentials:
+    """Test cases for env-var/file credential resolution."""
+
+    def _clear_env(self, monkeypatch):
+        for _, env_var, _ in pi_utils._ENV_MAP:  # pylint: disable=protected-access
+            monkeypatch.delenv(env_var, raising=False)
+
+    def test_env_vars_only_skip_credentials_file(self, monkeypatch, tmp_path):
+        """Test env vars alone are sufficient; the file is not read."""
+        self._clear_env(monkeypatch)
+        monkeypatch.setenv('PRIMEINTELLECT_API_KEY', 'env-key')
+        monkeypatch.setenv('PRIMEINTELLECT_TEAM_ID', 'env-team')
+
+        credentials = pi_utils.resolve_credentials(
+            str(tmp_path / 'missing.json'))
+
+        assert credentials['api_key'] == 'env-key'
+        assert credentials['team_id'] == 'env-team'
+
+    def test_env_vars_override_file_values(self, monkeypatch, tmp_path):
+        """Test partial env vars are merged over file values."""
+        self._clear_env(monkeypatch)
+        cred_file = tmp_path / 'config.json'
+        cred_file.write_text('{"api_key": "file-key", "team_id": "file-team"}')
+        monkeypatch.setattr(pi_utils, '_credentials_cache', None)
+        monkeypatch.setenv('PRIMEINTELLECT_BASE_URL', 'https://env.api')
+
+        credentials = pi_utils.resolve_credentials(str(cred_file))
+
+        assert credentials['api_key'] == 'file-key'
+        assert credentials['team_id'] == 'file-team'
+        assert credentials['base_url'] == 'https://env.api'
+
+    def test_missing_file_without_env_raises(self, monkeypatch, tmp_path):
+        """Test the file is still required when no API key env var is set."""
+        self._clear_env(monkeypatch)
+        monkeypatch.setattr(pi_utils, '_credentials_cache', None)
+
+        with pytest.raises(pi_utils.PrimeintellectAPIError,
+                           match='credentials not found'):
+            pi_utils.resolve_credentials(str(tmp_path / 'missing.json'))
+
+
+class TestCheckCredentials:
+    """Test cases for PrimeIntellect._check_credentials."""
+
+    def _clear_env(self, monkeypatch):
+        for _, env_var, _ in pi_utils._ENV_MAP:  # pylint: disable=protected-access
+            monkeypatch.delenv(env_var, raising=False)
+
+    def test_env_api_key_passes_without_credentials_file(
+            self, monkeypatch, tmp_path):
+        """Test PRIMEINTELLECT_API_KEY alone satisfies the check."""
+        self._clear_env(monkeypatch)
+        monkeypatch.setenv('PRIMEINTELLECT_API_KEY', 'env-key')
+        monkeypatch.setattr(pi_utils, 'CREDENTIALS_PATH',
+                            str(tmp_path / 'missing.json'))
+
+        class _FakeClient:
+
+            def list_instances(self):
+                return []
+
+        monkeypatch.setattr(pi_utils, '_client', _FakeClient())
+
+        valid, message = pi_cloud.PrimeIntellect._check_credentials()  # pylint: disable=protected-access
+
+        assert valid, message
+
+    def test_missing_file_without_env_fails(self, monkeypatch, tmp_path):
+        """Test the check fails when neither the env var nor the file exist."""
+        self._clear_env(monkeypatch)
+        monkeypatch.setattr(pi_utils, 'CREDENTIALS_PATH',
+                            str(tmp_path / 'missing.json'))
+        monkeypatch.setattr(pi_utils, '_credentials_cache', None)
+
+        valid, message = pi_cloud.PrimeIntellect._check_credentials()  # pylint: disable=protected-access
+
+        assert not valid
+        assert 'credentials not found' in message
+
+
+class TestGetOrAddSshKey:
+    """Test cases for PrimeIntellectAPIClient.get_or_add_ssh_key."""
+
+    def _make_client(self):
+        client = pi_utils.PrimeIntellectAPIClient.__new__(
+            pi_utils.PrimeIntellectAPIClient)
+        client.base_url = 'https://api.test'
+        client.headers = {}
+        client._session = None  # pylint: disable=protected-access
+        return client
+
+    def test_existing_key_is_reused(self, monkeypatch):
+        """Test a key matching on (algo, blob) is not re-uploaded."""
+        client = self._make_client()
+        monkeypatch.setattr(
+            client, 'list_ssh_keys', lambda: [{
+                'name': 'existing-key',
+                'publicKey': 'ssh-ed25519 AAAAblob some-comment',
+            }])
+        posts = []
+        monkeypatch.setattr(pi_utils, '_try_request_with_backoff',
+                            lambda *args, **kwargs: posts.append(args))
+
+        result = client.get_or_add_ssh_key('ssh-ed25519 AAAAblob other-host')
+
+        assert result['name'] == 'existing-key'
+        assert not posts
+
+    def test_new_key_is_uploaded(self, monkeypatch):
+        """Test a key with no match is uploaded."""
+        client = self._make_client()
+        monkeypatch.setattr(
+            client, 'list_ssh_keys', lambda: [{
+                'name': 'existing-key',
+                'publicKey': 'ssh-ed25519 AAAAother some-comment',
+            }])
+        posts = []
+        monkeypatch.setattr(
+            pi_utils, '_try_request_with_backoff',
+            lambda *args, **kwargs: posts.append(kwargs.get('data')))
+
+        result = client.get_or_add_ssh_key('ssh-ed25519 AAAAblob host')
+
+        assert result['name'].startswith('skypilot-')
+        assert len(posts) == 1
+        assert posts[0]['publicKey'] == 'ssh-ed25519 AAAAblob host'
+
+
+class TestLazyClientSingleton:
+    """Test cases for the module-level lazy client."""
+
+    def test_client_is_constructed_once(self, monkeypatch):
+        """Test utils.client builds the client lazily and reuses it."""
+        constructed = []
+
+        class _FakeClient:
+
+            def __init__(self):
+                constructed.append(self)
+
+        monkeypatch.setattr(pi_utils, 'PrimeIntellectAPIClient', _FakeClient)
+        monkeypatch.setattr(pi_utils, '_client', None)
+
+        first = pi_utils.client
+        second = pi_utils.client
+
+        assert first is second
+        assert len(constructed) == 1
+
+    def test_unknown_attribute_raises(self):
+        """Test unknown module attributes still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            _ = pi_utils.nonexistent_attribute
+
+
+class TestCredentialRefreshOn401:
+    """Test cases for the 401 credentials-reload path."""
+
+    def test_401_reloads_credentials_and_retries_once(self, monkeypatch,
+                                                      tmp_path):
+        """Test an auth failure re-reads the key and retries the call."""
+        cred_file = tmp_path / 'config.json'
+        cred_file.write_text('{"api_key": "new-key"}')
+        monkeypatch.setattr(pi_utils, '_credentials_cache', None)
+
+        client = pi_utils.PrimeIntellectAPIClient.__new__(
+            pi_utils.PrimeIntellectAPIClient)
+        client.credentials = str(cred_file)
+        client.base_url = 'https://api.test'
+        client.api_key = 'old-key'
+        client.team_id = None
+        client.headers = {
+            'Authorization': 'Bearer old-key',
+            'Content-Type': 'application/json',
+        }
+        session = _FakeSession([
+            _FakeResponse(status_code=401, payload={'message': 'Unauthorized'}),
+            _FakeResponse(payload={'data': []}),
+        ])
+        client._session = session  # pylint: disable=protected-access
+
+        assert client.list_instances() == []
+        assert client.api_key == 'new-key'
+        retry_headers = session.calls[1][2]['headers']
+        assert retry_headers['Authorization'] == 'Bearer new-key'
+
+    def test_non_auth_errors_are_not_retried(self, monkeypatch):
+        """Test non-401 API errors propagate without a credentials reload."""
+        client = pi_utils.PrimeIntellectAPIClient.__new__(
+            pi_utils.PrimeIntellectAPIClient)
+        client.base_url = 'https://api.test'
+        client.headers = {}
+        session = _FakeSession(
+            [_FakeResponse(status_code=403, payload={'message': 'Forbidden'})])
+        client._session = session  # pylint: disable=protected-access
+        monkeypatch.setattr(
+            client, '_refresh_credentials',
+            lambda: pytest.fail('credentials should not be reloaded'))
+
+        with pytest.raises(pi_utils.PrimeintellectAPIError, match='Forbidden'):
+            client.list_instances()
+
+        assert len(session.calls) == 1
+
+
+class TestLaunch:
+    """Test cases for PrimeIntellectAPIClient.launch payload building."""
+
+    def _launch_payload(self, monkeypatch, instance_type):
+        client = pi_utils.PrimeIntellectAPIClient.__new__(
+            pi_utils.PrimeIntellectAPIClient)
+        client.base_url = 'https://api.test'
+        client.headers = {}
+        client.team_id = None
+        client._session = None  # pylint: disable=protected-access
+        monkeypatch.setattr(pi_utils, 'get_upstream_cloud_id',
+                            lambda instance_type: 'cloud-1')
+        payloads = []
+
+        def _fake_request(*args, **kwargs):
+            del args  # unused
+            payloads.append(kwargs['data'])
+            return {'id': 'pod-1'}
+
+        monkeypatch.setattr(pi_utils, '_try_request_with_backoff',
+                            _fake_request)
+        client.launch(name='test-pod',
+                      instance_type=instance_type,
+                      region='US',
+                      availability_zone='dc-1',
+                      disk_size=100)
+        return payloads[0]
+
+    def test_gpu_instance_type(self, monkeypatch):
+        """Test GPU count/type are parsed from the accelerator component."""
+        payload = self._launch_payload(monkeypatch,
+                                       'primecompute__8xH100_80GB__104__752')
+
+        assert payload['provider']['type'] == 'primecompute'
+        assert payload['pod']['gpuType'] == 'H100_80GB'
+        assert payload['pod']['gpuCount'] == 8
+
+    def test_cpu_node_instance_type(self, monkeypatch):
+        """Test the CPU_NODE sentinel maps to gpuType=CPU_NODE, count 1."""
+        payload = self._launch_payload(monkeypatch,
+                                       'primecompute__CPU_NODE__8__32')
+
+        assert payload['provider']['type'] == 'primecompute'
+        assert payload['pod']['gpuType'] == 'CPU_NODE'
+        assert payload['pod']['gpuCount'] == 1
+
+
+class TestUpstreamCloudIdLookup:
+    """Test cases for the catalog-backed UpstreamCloudId lookup."""
+
+    def test_lookup_from_catalog_csv(self, monkeypatch, tmp_path):
+        """Test the lookup dict is built from the catalog CSV."""
+        catalog_file = tmp_path / 'vms.csv'
+        catalog_file.write_text(
+            'InstanceType,UpstreamCloudId,Price\n'
+            'primecompute__8xH100_80GB__104__752,cloud-1,10.0\n'
+            'primecompute__CPU_NODE__8__32,cloud-2,1.0\n')
+        monkeypatch.setattr(pi_utils.catalog_common, 'get_catalog_path',
+                            lambda filename: str(catalog_file))
+        pi_utils._get_upstream_cloud_id_lookup.cache_clear()  # pylint: disable=protected-access
+
+        assert pi_utils.get_upstream_cloud_id(
+            'primecompute__8xH100_80GB__104__752') == 'cloud-1'
+        assert pi_utils.get_upstream_cloud_id(
+            'primecompute__CPU_NODE__8__32') == 'cloud-2'
+        assert pi_utils.get_upstream_cloud_id('nonexistent') is None
+
+    def test_lookup_is_cached(self, monkeypatch, tmp_path):
+        """Test the catalog file is only parsed once per process."""
+        catalog_file = tmp_path / 'vms.csv'
+        catalog_file.write_text('InstanceType,UpstreamCloudId\n'
+                                'instance-a,cloud-a\n')
+        calls = []
+
+        def _get_catalog_path(filename):
+            calls.append(filename)
+            return str(catalog_file)
+
+        monkeypatch.setattr(pi_utils.catalog_common, 'get_catalog_path',
+                            _get_catalog_path)
+        pi_utils._get_upstream_cloud_id_lookup.cache_clear()  # pylint: disable=protected-access
+
+        pi_utils.get_upstream_cloud_id('instance-a')
+        pi_utils.get_upstream_cloud_id('instance-a')
+
+        assert len(calls) == 1